@@ -6,9 +6,11 @@ Panasonic Viera TV integration for Unfolded Circle Remote.
 """
 
 import asyncio
+import contextlib
+import functools
 import json
 import logging
-import os
+import signal
 from pathlib import Path
 from ucapi import DeviceStates
 from ucapi_framework import get_config_path, BaseConfigManager
@@ -16,18 +18,29 @@ from intg_panasonicviera.driver import PanasonicVieraDriver
 from intg_panasonicviera.setup_flow import PanasonicVieraSetupFlow
 from intg_panasonicviera.config import PanasonicVieraConfig
 
-try:
-    driver_path = Path(__file__).parent.parent / "driver.json"
-    with open(driver_path, "r", encoding="utf-8") as f:
-        driver_info = json.load(f)
-        __version__ = driver_info.get("version", "0.0.0")
-except (FileNotFoundError, json.JSONDecodeError, KeyError):
-    __version__ = "0.0.0"
-
 __all__ = ["__version__"]
 
 _LOG = logging.getLogger(__name__)
 
+_DRIVER_JSON_PATH = Path(__file__).resolve().parent.parent / "driver.json"
+
+
+@functools.cache
+def _load_version() -> str:
+    """Read the integration version from driver.json once, on first use."""
+    try:
+        driver_info = json.loads(_DRIVER_JSON_PATH.read_bytes())
+        return driver_info.get("version", "0.0.0")
+    except (FileNotFoundError, json.JSONDecodeError, KeyError):
+        return "0.0.0"
+
+
+def __getattr__(name: str):
+    # __version__ is resolved lazily so importing the package doesn't touch the disk
+    if name == "__version__":
+        return _load_version()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 async def main():
     """Main entry point."""
@@ -36,8 +49,16 @@ async def main():
         format="%(asctime)s | %(levelname)-8s | %(name)-20s | %(message)s",
     )
 
-    _LOG.info("Starting Panasonic Viera TV Integration v%s", __version__)
+    _LOG.info("Starting Panasonic Viera TV Integration v%s", _load_version())
+
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        # Not available on Windows event loops, KeyboardInterrupt still applies there
+        with contextlib.suppress(NotImplementedError):
+            loop.add_signal_handler(sig, stop_event.set)
 
+    driver = None
     try:
         # Create driver
         driver = PanasonicVieraDriver()
@@ -58,29 +79,32 @@ async def main():
         setup_handler = PanasonicVieraSetupFlow.create_handler(driver)
 
         # Initialize API (requires driver.json at project root!)
-        driver_path = os.path.join(os.path.dirname(__file__), "..", "driver.json")
-        await driver.api.init(os.path.abspath(driver_path), setup_handler)
+        await driver.api.init(str(_DRIVER_JSON_PATH), setup_handler)
 
         # Register configured devices
-        await driver.register_all_configured_devices(connect=False)
+        await driver.register_all_device_instances(connect=False)
 
         # Set initial state
-        device_count = len(list(config_manager.all()))
-        if device_count > 0:
+        has_devices = next(iter(config_manager.all()), None) is not None
+        if has_devices:
             await driver.api.set_device_state(DeviceStates.CONNECTED)
         else:
             await driver.api.set_device_state(DeviceStates.DISCONNECTED)
 
         _LOG.info("Panasonic Viera TV integration started")
 
-        # Keep running
-        await asyncio.Future()
+        # Keep running until asked to stop
+        await stop_event.wait()
+        _LOG.info("Stop signal received, shutting down")
 
     except KeyboardInterrupt:
         _LOG.info("Integration stopped by user")
     except Exception as err:
         _LOG.critical("Fatal error: %s", err, exc_info=True)
         raise
+    finally:
+        if driver is not None:
+            driver.shutdown()
 
 
 if __name__ == "__main__":
@@ -7,9 +7,16 @@ Panasonic Viera TV device implementation for Unfolded Circle integration.
 
 import asyncio
 import logging
+import re
 import socket
-from typing import Any
-from panasonic_viera import RemoteControl
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from operator import attrgetter
+from typing import Any, Callable, Coroutine
+from urllib.error import URLError
+from panasonic_viera import RemoteControl, SOAPError
 from ucapi_framework import PollingDevice, DeviceEvents
 from ucapi.media_player import Attributes as MediaAttributes
 from ucapi.remote import Attributes as RemoteAttributes
@@ -17,12 +24,85 @@ from intg_panasonicviera.config import PanasonicVieraConfig
 
 _LOG = logging.getLogger(__name__)
 
+_POLL_INTERVAL = 30
+_TRANSITION_POLL_INTERVAL = 10
+_STEADY_POLL_INTERVAL = 60
+_STABLE_POLLS = 5
+_MAX_POLL_INTERVAL = 300
+_APPS_CACHE_TTL = 600
+_KEY_BATCH_WINDOW = 0.015
+_PROBE_TIMEOUT = 1.0
+_CALL_TIMEOUT = 10
+
+_ENCRYPTION_ERROR_RE = re.compile(r"encryption|refer to the docs", re.IGNORECASE)
+_GET_NAME = attrgetter("name")
+
+# Attribute keys resolved once; _emit_update only zips in the current values
+_MEDIA_KEYS = (
+    MediaAttributes.STATE,
+    MediaAttributes.VOLUME,
+    MediaAttributes.MUTED,
+    MediaAttributes.SOURCE,
+    MediaAttributes.SOURCE_LIST,
+)
+_REMOTE_STATE_KEY = RemoteAttributes.STATE
+
+
+def _build_magic_packet(mac_address: str) -> bytes | None:
+    """Build the Wake-on-LAN magic packet for a MAC address, or None if it is invalid."""
+    # Supports formats: AA:BB:CC:DD:EE:FF, AA-BB-CC-DD-EE-FF, AABBCCDDEEFF
+    mac = mac_address.replace(":", "").replace("-", "")
+    if len(mac) != 12:
+        return None
+    try:
+        mac_bytes = bytes.fromhex(mac)
+    except ValueError:
+        return None
+    # 6 bytes of FF followed by the MAC repeated 16 times
+    return b"\xFF" * 6 + mac_bytes * 16
+
+
+def open_wol_socket() -> socket.socket:
+    """Open a UDP socket for sending Wake-on-LAN broadcasts."""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+    # Bind explicitly so datagrams always leave from a concrete local address
+    sock.bind(("", 0))
+    # Sends go through loop.sock_sendto on the event loop, which requires a non-blocking socket
+    sock.setblocking(False)
+    return sock
+
+
+def _run_in_own_thread(fn: Callable[..., Any], *args: Any) -> asyncio.Future:
+    """Run a blocking call on a fresh daemon thread, for calls that may never return."""
+    future: Future = Future()
+
+    def runner() -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(fn(*args))
+        except BaseException as err:
+            future.set_exception(err)
+
+    threading.Thread(target=runner, name="viera-webpage", daemon=True).start()
+    return asyncio.wrap_future(future)
+
+
+def _app_names(apps_list: list[Any]) -> list[str]:
+    """Return display names for a homogeneous app list, checking the element type only once."""
+    if apps_list and hasattr(apps_list[0], "name"):
+        return list(map(_GET_NAME, apps_list))
+    return list(map(str, apps_list))
+
 
 class PanasonicVieraDevice(PollingDevice):
 
     def __init__(self, device_config: PanasonicVieraConfig, **kwargs):
-        super().__init__(device_config, poll_interval=30, **kwargs)
+        super().__init__(device_config, poll_interval=_POLL_INTERVAL, **kwargs)
         self._device_config = device_config
+        self._host = device_config.host
+        self._log_id = f"{device_config.name} ({device_config.host})"
         self._remote: RemoteControl | None = None
         self._power_state: bool = False
         self._volume: int = 0
@@ -30,7 +110,43 @@ class PanasonicVieraDevice(PollingDevice):
         self._current_source: str = ""
         self._source_list: list[str] = []
         self._apps_list: list[Any] = []
+        self._apps_cache: dict[str, Any] = {}
+        self._apps_cache_ts: float = 0.0
         self._apps_update_callback = None
+        self._poll_failures: int = 0
+        self._stable_polls: int = 0
+        self._last_emitted: tuple | None = None
+        self._media_player_id = f"media_player.{device_config.identifier}"
+        self._remote_id = f"remote.{device_config.identifier}"
+        # Last emitted attributes; every emit builds new dicts instead of mutating these, since
+        # the framework handles updates in a scheduled task that reads the dict later
+        self._media_player_attrs: dict[str, Any] = {
+            MediaAttributes.STATE: "OFF",
+            MediaAttributes.VOLUME: 0,
+            MediaAttributes.MUTED: False,
+            MediaAttributes.SOURCE: "",
+            MediaAttributes.SOURCE_LIST: [],
+        }
+        self._remote_attrs: dict[str, Any] = {RemoteAttributes.STATE: "OFF"}
+        self._key_queue: asyncio.Queue[tuple[str, asyncio.Future]] = asyncio.Queue()
+        self._key_worker_task: asyncio.Task | None = None
+        self._power_check_task: asyncio.Task | None = None
+        self._sources_task: asyncio.Task | None = None
+        self._io_lock = asyncio.Lock()
+        self._wol_sock: socket.socket | None = None
+        self._magic_packet: bytes | None = None
+        if device_config.mac_address:
+            self._magic_packet = _build_magic_packet(device_config.mac_address)
+            if self._magic_packet is None:
+                _LOG.error("[%s] Invalid MAC address format: %s", self._log_id, device_config.mac_address)
+        # RemoteControl is blocking; a small per-device pool keeps one slow TV from
+        # starving the default executor shared with everything else in the process.
+        # Calls are already serialized by _io_lock, the second worker only takes over
+        # while a timed-out call is still finishing (urlopen gives up after 5 seconds).
+        # open_webpage can wait in accept() forever and gets a thread of its own instead
+        self._executor = ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix=f"viera-{device_config.identifier}"
+        )
 
     @property
     def identifier(self) -> str:
@@ -42,11 +158,11 @@ class PanasonicVieraDevice(PollingDevice):
 
     @property
     def address(self) -> str:
-        return self._device_config.host
+        return self._host
 
     @property
     def log_id(self) -> str:
-        return f"{self.name} ({self.address})"
+        return self._log_id
 
     @property
     def power(self) -> bool:
@@ -68,80 +184,198 @@ class PanasonicVieraDevice(PollingDevice):
     def source_list(self) -> list[str]:
         return self._source_list
 
+    async def _call(
+        self, fn: Callable[..., Any], *args: Any, timeout: float = _CALL_TIMEOUT, own_thread: bool = False
+    ) -> Any:
+        """Run a blocking RemoteControl call on this device's executor, or on its own thread.
+
+        A stuck call raises asyncio.TimeoutError after `timeout` seconds; the worker thread
+        may still finish in the background, but the caller and the poll loop move on.
+        """
+        if own_thread:
+            future = _run_in_own_thread(fn, *args)
+        else:
+            future = asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+        return await asyncio.wait_for(future, timeout)
+
+    def shutdown(self) -> None:
+        """Stop polling and release the device executor; the device must not be used afterwards."""
+        # remove_device doesn't disconnect the device, so the poll loop is stopped here
+        self._stop_polling.set()
+        if self._poll_task:
+            self._poll_task.cancel()
+        if self._key_worker_task:
+            self._key_worker_task.cancel()
+        # Fail queued key presses so their callers don't wait forever
+        while not self._key_queue.empty():
+            _, result = self._key_queue.get_nowait()
+            if not result.done():
+                result.set_result(False)
+        if self._power_check_task:
+            self._power_check_task.cancel()
+        if self._sources_task:
+            self._sources_task.cancel()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        # The driver's shared socket outlives individual devices and is closed by the driver
+        if self._wol_sock is not None:
+            self._wol_sock.close()
+            self._wol_sock = None
+
     async def _create_remote_control(self) -> RemoteControl:
-        if self._device_config.app_id and self._device_config.encryption_key:
+        config = self._device_config
+
+        if config.app_id and config.encryption_key:
             _LOG.debug("[%s] Creating encrypted RemoteControl", self.log_id)
-            return await asyncio.to_thread(
+            return await self._call(
                 RemoteControl,
-                self._device_config.host,
-                self._device_config.port,
-                self._device_config.app_id,
-                self._device_config.encryption_key,
-            )
-        else:
-            _LOG.debug("[%s] Creating non-encrypted RemoteControl", self.log_id)
-            return await asyncio.to_thread(
-                RemoteControl,
-                self._device_config.host,
-                self._device_config.port,
+                config.host,
+                config.port,
+                config.app_id,
+                config.encryption_key,
             )
 
+        _LOG.debug("[%s] Creating non-encrypted RemoteControl", self.log_id)
+        return await self._call(
+            RemoteControl,
+            config.host,
+            config.port,
+        )
+
+    async def _get_remote(self) -> RemoteControl:
+        """Return this device's RemoteControl, creating it on first use."""
+        if self._remote is None:
+            self._remote = await self._create_remote_control()
+        return self._remote
+
+    def _invalidate_remote(self, remote: RemoteControl) -> None:
+        """Drop a RemoteControl that failed so the next call builds a fresh one."""
+        if self._remote is remote:
+            self._remote = None
+
+    async def _call_remote(
+        self, fn: Callable[..., Any], *args: Any, retry: bool = False, own_thread: bool = False
+    ) -> Any:
+        """Run fn(remote, *args) with the device's RemoteControl.
+
+        Connection and HTTP/SOAP errors (e.g. an encrypted session the TV dropped when it
+        went through standby) drop the RemoteControl so the next call builds a fresh one.
+        Only reads pass retry=True to be replayed once on the new connection; commands are
+        never replayed, the TV may already have acted on them. A timed-out call may still
+        be running on the RemoteControl, so it is dropped as well and the timeout raised.
+        """
+        # RemoteControl isn't thread-safe (encrypted calls share a sequence number),
+        # so TV access from polls, commands and the key worker is serialized
+        async with self._io_lock:
+            remote = await self._get_remote()
+            try:
+                return await self._call(fn, remote, *args, own_thread=own_thread)
+            except TimeoutError:
+                # Call and read timeouts; urlopen wraps connect timeouts in URLError, handled below
+                self._invalidate_remote(remote)
+                raise
+            except (OSError, SOAPError) as err:
+                self._invalidate_remote(remote)
+                # An unresponsive TV won't answer a retry either
+                if not retry or (isinstance(err, URLError) and isinstance(err.reason, TimeoutError)):
+                    raise
+                _LOG.debug("[%s] TV call failed, retrying with a new connection: %s", self.log_id, err)
+
+            remote = await self._get_remote()
+            return await self._call(fn, remote, *args, own_thread=own_thread)
+
     async def establish_connection(self) -> Any:
         _LOG.debug("[%s] Establishing connection", self.log_id)
         try:
-            self._remote = await self._create_remote_control()
-
-            volume = await asyncio.to_thread(self._remote.get_volume)
+            # A reconnect keeps the device's RemoteControl unless a failed call already dropped it
+            volume, mute = await self._call_remote(self._read_status, retry=True)
             if volume is not None:
                 self._volume = volume
+                if mute is not None:
+                    self._muted = mute
                 self._power_state = True
                 _LOG.info("[%s] Connection established, TV is ON (volume: %d)", self.log_id, volume)
             else:
                 self._power_state = False
                 _LOG.info("[%s] Connection established, TV is OFF", self.log_id)
 
-            self._emit_update()
+            self._emit_update(force=True)
             return self._remote
 
         except Exception as err:
             _LOG.error("[%s] Connection failed: %s", self.log_id, err)
             self._power_state = False
-            self._emit_update()
+            self._emit_update(force=True)
             raise
 
+    @staticmethod
+    def _read_status(remote: RemoteControl) -> tuple[int | None, bool | None]:
+        """Read volume and mute in one worker hop; a failed mute read is not fatal."""
+        volume = remote.get_volume()
+        try:
+            mute = remote.get_mute()
+        except Exception as err:
+            _LOG.debug("Get mute failed: %s", err)
+            mute = None
+        return volume, mute
+
+    async def _tcp_alive(self) -> bool:
+        """Return True if the TV accepts a TCP connection on its control port."""
+        try:
+            _, writer = await asyncio.wait_for(
+                asyncio.open_connection(self._host, self._device_config.port),
+                _PROBE_TIMEOUT,
+            )
+        except (OSError, asyncio.TimeoutError):
+            return False
+
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except OSError:
+            pass
+        return True
+
     async def poll_device(self) -> None:
-        if not self._remote:
-            _LOG.debug("[%s] No remote connection, skipping poll", self.log_id)
+        # A refused or silent control port means the TV is off, no need to wait on SOAP timeouts
+        if not await self._tcp_alive():
+            _LOG.debug("[%s] Control port unreachable (TV likely off)", self.log_id)
+            self._update_poll_interval(reachable=False)
+            if self._power_state:
+                _LOG.info("[%s] TV is now OFF or unreachable", self.log_id)
+                self._power_state = False
+                self._emit_update()
             return
 
         try:
-            remote = await self._create_remote_control()
-
-            volume = await asyncio.to_thread(remote.get_volume)
+            volume, mute = await self._call_remote(self._read_status, retry=True)
 
+            powered_on = volume is not None and not self._power_state
             if volume is not None:
                 self._volume = volume
 
-                mute = await asyncio.to_thread(remote.get_mute)
                 if mute is not None:
                     self._muted = mute
 
-                if not self._power_state:
+                if powered_on:
                     _LOG.info("[%s] TV is now ON", self.log_id)
-                    await self.get_sources()
+                    self._expect_transition()
 
                 self._power_state = True
+                self._update_poll_interval(reachable=True)
             else:
                 if self._power_state:
                     _LOG.info("[%s] TV is now OFF", self.log_id)
                 self._power_state = False
+                self._update_poll_interval(reachable=False)
 
             self._emit_update()
 
-        except Exception as err:
-            error_str = str(err).lower()
+            # get_sources returns nothing while the TV is off, so fetch only once power is set
+            if powered_on:
+                await self.get_sources()
 
-            if "encryption" in error_str or "refer to the docs" in error_str:
+        except Exception as err:
+            if _ENCRYPTION_ERROR_RE.search(str(err)):
                 _LOG.error(
                     "[%s] TV requires encryption but credentials not configured.",
                     self.log_id
@@ -149,98 +383,187 @@ class PanasonicVieraDevice(PollingDevice):
             else:
                 _LOG.debug("[%s] Poll error (TV likely off): %s", self.log_id, err)
 
+            self._update_poll_interval(reachable=False)
+
             if self._power_state:
                 _LOG.info("[%s] TV is now OFF or unreachable", self.log_id)
                 self._power_state = False
                 self._emit_update()
 
-    def _emit_update(self) -> None:
-        media_player_id = f"media_player.{self.identifier}"
-        state_value = "ON" if self._power_state else "OFF"
+    def _update_poll_interval(self, reachable: bool) -> None:
+        """Slow down once the TV has been steady for a while, back off while it is off or unreachable."""
+        if reachable:
+            self._poll_failures = 0
+            self._stable_polls += 1
+            if self._stable_polls >= _STABLE_POLLS:
+                self._poll_interval = _STEADY_POLL_INTERVAL
+            elif self._poll_interval > _POLL_INTERVAL:
+                self._poll_interval = _POLL_INTERVAL
+            return
 
-        media_player_attrs = {
-            MediaAttributes.STATE: state_value,
-            MediaAttributes.VOLUME: self._volume,
-            MediaAttributes.MUTED: self._muted,
-            MediaAttributes.SOURCE: self._current_source,
-            MediaAttributes.SOURCE_LIST: self._source_list,
-        }
+        self._stable_polls = 0
+        self._poll_failures += 1
+        self._poll_interval = min(_MAX_POLL_INTERVAL, _POLL_INTERVAL * 2 ** self._poll_failures)
+        _LOG.debug("[%s] Next poll in %d seconds", self.log_id, self._poll_interval)
 
-        _LOG.debug("[%s] Emitting update: %s", self.log_id, state_value)
-        self.events.emit(DeviceEvents.UPDATE, media_player_id, media_player_attrs)
+    def _expect_transition(self) -> None:
+        """Poll quickly for a few rounds after a power change so the real state shows up sooner."""
+        self._poll_failures = 0
+        self._stable_polls = 0
+        self._poll_interval = _TRANSITION_POLL_INTERVAL
 
-        remote_id = f"remote.{self.identifier}"
-        remote_attrs = {
-            RemoteAttributes.STATE: state_value,
-        }
-        self.events.emit(DeviceEvents.UPDATE, remote_id, remote_attrs)
+    def _emit_update(self, force: bool = False) -> None:
+        state_value = "ON" if self._power_state else "OFF"
+        # Mirror power into the framework state so connect/refresh handlers map it correctly
+        self._state = state_value
+
+        state = (
+            self._power_state,
+            self._volume,
+            self._muted,
+            self._current_source,
+            # get_sources always assigns a new list, so holding the reference is enough for the comparison
+            self._source_list,
+        )
+        if not force and state == self._last_emitted:
+            return
+        power_changed = self._last_emitted is None or self._last_emitted[0] != self._power_state
+        self._last_emitted = state
+
+        media_player_attrs = dict(
+            zip(_MEDIA_KEYS, (state_value, self._volume, self._muted, self._current_source, self._source_list))
+        )
+        self._media_player_attrs = media_player_attrs
 
-    def _send_wol_packet(self, mac_address: str) -> bool:
+        _LOG.debug("[%s] Emitting update: %s", self.log_id, state_value)
+        self.events.emit(DeviceEvents.UPDATE, self._media_player_id, media_player_attrs)
+
+        # The remote entity only carries power state
+        if force or power_changed:
+            self._remote_attrs = {_REMOTE_STATE_KEY: state_value}
+            self.events.emit(DeviceEvents.UPDATE, self._remote_id, self._remote_attrs)
+
+    def get_device_attributes(self, entity_id: str) -> dict[str, Any] | None:
+        """Return the last emitted attributes so entity refreshes never need a TV round-trip."""
+        if self._last_emitted is None:
+            return None
+        if entity_id == self._media_player_id:
+            return self._media_player_attrs
+        if entity_id == self._remote_id:
+            return self._remote_attrs
+        return None
+
+    async def _send_wol_packet(self) -> bool:
         """Send Wake-on-LAN magic packet to TV on multiple ports."""
         try:
-            # Parse MAC address (supports formats: AA:BB:CC:DD:EE:FF, AA-BB-CC-DD-EE-FF, AABBCCDDEEFF)
-            mac = mac_address.replace(":", "").replace("-", "").upper()
-            if len(mac) != 12:
-                _LOG.error("[%s] Invalid MAC address format: %s", self.log_id, mac_address)
-                return False
-
-            # Convert MAC to bytes
-            mac_bytes = bytes.fromhex(mac)
-
-            # Create magic packet (6 bytes of FF followed by MAC repeated 16 times)
-            magic_packet = b"\xFF" * 6 + mac_bytes * 16
-
-            # Send to multiple common WoL ports for better compatibility
-            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
-
-            # Port 9 (most common)
-            sock.sendto(magic_packet, ("<broadcast>", 9))
-            # Port 7 (also common)
-            sock.sendto(magic_packet, ("<broadcast>", 7))
-            # Direct to TV IP on port 9 (in case broadcast is blocked)
-            sock.sendto(magic_packet, (self._device_config.host, 9))
-
-            sock.close()
+            magic_packet = self._magic_packet
+            sock = self._get_wol_socket()
+            loop = asyncio.get_running_loop()
+
+            # Send to multiple common WoL ports for better compatibility:
+            # broadcast on 9 (most common) and 7, plus direct to the TV in case broadcast is blocked
+            await asyncio.gather(
+                loop.sock_sendto(sock, magic_packet, ("<broadcast>", 9)),
+                loop.sock_sendto(sock, magic_packet, ("<broadcast>", 7)),
+                loop.sock_sendto(sock, magic_packet, (self._host, 9)),
+            )
 
             _LOG.info("[%s] Sent WoL magic packets to %s (broadcast ports 7&9, direct to %s:9)",
-                     self.log_id, mac_address, self._device_config.host)
+                     self.log_id, self._device_config.mac_address, self._host)
             return True
 
         except Exception as err:
             _LOG.error("[%s] Failed to send WoL packet: %s", self.log_id, err)
+            self._close_wol_socket()
             return False
 
+    def _get_wol_socket(self) -> socket.socket:
+        """Return the driver's shared broadcast socket, or a device-owned one when running without a driver."""
+        if self._driver is not None:
+            return self._driver.wol_socket()
+        if self._wol_sock is None:
+            self._wol_sock = open_wol_socket()
+        return self._wol_sock
+
+    def _close_wol_socket(self) -> None:
+        """Drop a socket that failed so the next wake opens a fresh one."""
+        if self._driver is not None:
+            self._driver.close_wol_socket()
+        elif self._wol_sock is not None:
+            self._wol_sock.close()
+            self._wol_sock = None
+
     async def turn_on(self) -> bool:
         _LOG.info("[%s] Turning on", self.log_id)
         try:
             # If MAC address is configured, use Wake-on-LAN
-            if self._device_config.mac_address:
+            if self._magic_packet:
                 _LOG.info("[%s] Using Wake-on-LAN with MAC: %s", self.log_id, self._device_config.mac_address)
-                await asyncio.to_thread(self._send_wol_packet, self._device_config.mac_address)
-                # Give TV time to wake up (WoL takes 5-10 seconds typically)
-                await asyncio.sleep(8)
+                await self._send_wol_packet()
             else:
                 # Fallback to remote.turn_on (less reliable for fully powered off TVs)
-                _LOG.info("[%s] No MAC address configured, using remote.turn_on", self.log_id)
-                remote = await self._create_remote_control()
-                await asyncio.to_thread(remote.turn_on)
-                await asyncio.sleep(2)
+                _LOG.info("[%s] No valid MAC address configured, using remote.turn_on", self.log_id)
+                await self._call_remote(RemoteControl.turn_on)
+
+            # Confirm the real state in the background instead of holding the command
+            self._start_power_check(self._verify_wake())
 
             self._power_state = True
+            self._expect_transition()
             self._emit_update()
             return True
         except Exception as err:
             _LOG.error("[%s] Turn on failed: %s", self.log_id, err)
             return False
 
+    async def _verify_wake(self, timeout: float = 15) -> None:
+        """Read the TV status every 2 seconds after power on until it answers or the timeout passes."""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            # WoL typically takes 5-10 seconds before the TV answers
+            await asyncio.sleep(2)
+            if not await self._tcp_alive():
+                continue
+            try:
+                volume, mute = await self._call_remote(self._read_status, retry=True)
+            except Exception as err:
+                _LOG.debug("[%s] TV not ready yet: %s", self.log_id, err)
+                continue
+            if volume is None:
+                continue
+
+            _LOG.info("[%s] TV confirmed ON", self.log_id)
+            self._volume = volume
+            if mute is not None:
+                self._muted = mute
+            self._power_state = True
+            self._emit_update()
+            await self.get_sources()
+            return
+
+        # The poll loop may still be sleeping through a long back-off interval, check right away
+        _LOG.debug("[%s] TV did not answer within %ss of power on, polling once more", self.log_id, timeout)
+        await self.poll_device()
+
+    async def _poll_after(self, delay: float) -> None:
+        """Poll once after `delay` seconds, independent of the poll loop's current wait."""
+        await asyncio.sleep(delay)
+        await self.poll_device()
+
+    def _start_power_check(self, check: Coroutine[Any, Any, None]) -> None:
+        """Run a check of the power state after a power command, replacing any pending one."""
+        if self._power_check_task:
+            self._power_check_task.cancel()
+        self._power_check_task = asyncio.create_task(check)
+
     async def turn_off(self) -> bool:
         _LOG.info("[%s] Turning off", self.log_id)
         try:
-            remote = await self._create_remote_control()
-            await asyncio.to_thread(remote.turn_off)
+            await self._call_remote(RemoteControl.turn_off)
             self._power_state = False
+            self._expect_transition()
             self._emit_update()
+            self._start_power_check(self._poll_after(_TRANSITION_POLL_INTERVAL))
             return True
         except Exception as err:
             _LOG.error("[%s] Turn off failed: %s", self.log_id, err)
@@ -249,8 +572,7 @@ class PanasonicVieraDevice(PollingDevice):
     async def set_volume(self, volume: int) -> bool:
         _LOG.info("[%s] Setting volume to %d", self.log_id, volume)
         try:
-            remote = await self._create_remote_control()
-            await asyncio.to_thread(remote.set_volume, volume)
+            await self._call_remote(RemoteControl.set_volume, volume)
             self._volume = volume
             self._emit_update()
             return True
@@ -261,8 +583,8 @@ class PanasonicVieraDevice(PollingDevice):
     async def volume_up(self) -> bool:
         _LOG.info("[%s] Volume up", self.log_id)
         try:
-            remote = await self._create_remote_control()
-            await asyncio.to_thread(remote.send_key, "NRC_VOLUP-ONOFF")
+            if not await self._queue_key("NRC_VOLUP-ONOFF"):
+                return False
             self._volume = min(100, self._volume + 2)
             self._emit_update()
             return True
@@ -273,8 +595,8 @@ class PanasonicVieraDevice(PollingDevice):
     async def volume_down(self) -> bool:
         _LOG.info("[%s] Volume down", self.log_id)
         try:
-            remote = await self._create_remote_control()
-            await asyncio.to_thread(remote.send_key, "NRC_VOLDOWN-ONOFF")
+            if not await self._queue_key("NRC_VOLDOWN-ONOFF"):
+                return False
             self._volume = max(0, self._volume - 2)
             self._emit_update()
             return True
@@ -285,8 +607,7 @@ class PanasonicVieraDevice(PollingDevice):
     async def mute(self, muted: bool) -> bool:
         _LOG.info("[%s] Setting mute to %s", self.log_id, muted)
         try:
-            remote = await self._create_remote_control()
-            await asyncio.to_thread(remote.set_mute, muted)
+            await self._call_remote(RemoteControl.set_mute, muted)
             self._muted = muted
             self._emit_update()
             return True
@@ -296,36 +617,86 @@ class PanasonicVieraDevice(PollingDevice):
 
     async def send_key(self, key: str) -> bool:
         _LOG.info("[%s] Sending key: %s", self.log_id, key)
-        try:
-            remote = await self._create_remote_control()
-            await asyncio.to_thread(remote.send_key, key)
-            return True
-        except Exception as err:
-            _LOG.error("[%s] Send key failed: %s", self.log_id, err)
-            return False
+        return await self._queue_key(key)
+
+    async def _queue_key(self, key: str) -> bool:
+        """Queue a key press for the key worker and wait until it has been sent."""
+        if self._key_worker_task is None or self._key_worker_task.done():
+            self._key_worker_task = asyncio.create_task(self._key_worker())
+
+        result = asyncio.get_running_loop().create_future()
+        self._key_queue.put_nowait((key, result))
+        return await result
+
+    async def _key_worker(self) -> None:
+        """Send queued key presses, coalescing bursts into a single executor job."""
+        while True:
+            batch = [await self._key_queue.get()]
+            try:
+                # Give held buttons a moment to queue their repeats
+                await asyncio.sleep(_KEY_BATCH_WINDOW)
+                while not self._key_queue.empty():
+                    batch.append(self._key_queue.get_nowait())
+
+                # Keys are popped once the TV accepted them; on an error the rest of the batch is
+                # reported as not sent instead of replayed, toggles like POWER or MUTE must not fire twice
+                pending = deque(key for key, _ in batch)
+                try:
+                    await self._call_remote(self._send_keys_sync, pending)
+                except Exception as err:
+                    _LOG.error("[%s] Send key failed: %s", self.log_id, err)
+
+                sent = len(batch) - len(pending)
+                if len(batch) > 1:
+                    _LOG.debug("[%s] Sent %d of %d coalesced key presses", self.log_id, sent, len(batch))
+
+                for index, (_, result) in enumerate(batch):
+                    if not result.done():
+                        result.set_result(index < sent)
+            finally:
+                # Shutdown cancels the worker mid-batch; its callers are told the keys weren't sent
+                for _, result in batch:
+                    if not result.done():
+                        result.set_result(False)
+
+    @staticmethod
+    def _send_keys_sync(remote: RemoteControl, keys: deque[str]) -> None:
+        while keys:
+            remote.send_key(keys[0])
+            keys.popleft()
 
     async def play_media(self, media_url: str) -> bool:
         _LOG.info("[%s] Playing media: %s", self.log_id, media_url)
         try:
-            remote = await self._create_remote_control()
-            await asyncio.to_thread(remote.open_webpage, media_url)
+            await self._call_remote(RemoteControl.open_webpage, media_url, own_thread=True)
             return True
         except Exception as err:
             _LOG.error("[%s] Play media failed: %s", self.log_id, err)
             return False
 
-    async def get_sources(self) -> list[str]:
+    async def get_sources(self, force: bool = False) -> list[str]:
+        """Return the TV's app names, fetching them again only when the cache is stale or force is set."""
         if not self._power_state:
             return []
 
+        # The installed apps rarely change, reuse the last list instead of another get_apps round-trip
+        if not force and self._source_list and time.monotonic() - self._apps_cache_ts < _APPS_CACHE_TTL:
+            return self._source_list
+
+        # Concurrent callers share one in-flight get_apps instead of each issuing their own
+        if self._sources_task is None or self._sources_task.done():
+            self._sources_task = asyncio.create_task(self._fetch_sources())
+        return await asyncio.shield(self._sources_task)
+
+    async def _fetch_sources(self) -> list[str]:
         try:
-            remote = await self._create_remote_control()
-            apps = await asyncio.to_thread(remote.get_apps)
+            apps = await self._call_remote(RemoteControl.get_apps, retry=True)
             if apps:
                 # Ensure apps is a list (handle generators, iterators, etc.)
                 apps_list = list(apps) if apps else []
                 self._apps_list = apps_list
-                self._source_list = [app.name if hasattr(app, 'name') else str(app) for app in apps_list]
+                self._source_list = _app_names(apps_list)
+                self._cache_apps(apps_list, self._source_list)
                 _LOG.debug("[%s] Found %d sources", self.log_id, len(self._source_list))
                 self._emit_update()
 
@@ -340,28 +711,33 @@ class PanasonicVieraDevice(PollingDevice):
             _LOG.debug("[%s] Get sources failed: %s", self.log_id, err)
             return []
 
+    def _cache_apps(self, apps_list: list[Any], names: list[str] | None = None) -> None:
+        """Remember the TV's apps by display name so launches skip the app list round-trip."""
+        self._apps_cache = dict(zip(names if names is not None else _app_names(apps_list), apps_list))
+        self._apps_cache_ts = time.monotonic()
+
     async def select_source(self, source: str) -> bool:
         _LOG.info("[%s] Selecting source: %s", self.log_id, source)
         try:
-            remote = await self._create_remote_control()
-            apps = await asyncio.to_thread(remote.get_apps)
-            if not apps:
+            app = self._apps_cache.get(source)
+            if app is None:
+                # Unknown name: the app list may have changed since it was cached, refresh it once
+                await self.get_sources(force=True)
+                app = self._apps_cache.get(source)
+
+            if not self._apps_cache:
                 _LOG.warning("[%s] No apps available", self.log_id)
                 return False
 
-            # Ensure apps is a list (handle generators, iterators, etc.)
-            apps_list = list(apps)
-            for app in apps_list:
-                app_name = app.name if hasattr(app, 'name') else str(app)
-                if app_name == source:
-                    await asyncio.to_thread(remote.launch_app, app)
-                    self._current_source = source
-                    self._emit_update()
-                    _LOG.info("[%s] Launched app: %s", self.log_id, source)
-                    return True
-
-            _LOG.warning("[%s] Source not found: %s", self.log_id, source)
-            return False
+            if app is None:
+                _LOG.warning("[%s] Source not found: %s", self.log_id, source)
+                return False
+
+            await self._call_remote(RemoteControl.launch_app, app)
+            self._current_source = source
+            self._emit_update()
+            _LOG.info("[%s] Launched app: %s", self.log_id, source)
+            return True
 
         except Exception as err:
             _LOG.error("[%s] Select source failed: %s", self.log_id, err)
@@ -372,8 +748,7 @@ class PanasonicVieraDevice(PollingDevice):
         app_name = app.name if hasattr(app, 'name') else str(app)
         _LOG.info("[%s] Launching app: %s", self.log_id, app_name)
         try:
-            remote = await self._create_remote_control()
-            await asyncio.to_thread(remote.launch_app, app)
+            await self._call_remote(RemoteControl.launch_app, app)
             self._current_source = app_name
             self._emit_update()
             return True
@@ -387,8 +762,7 @@ class PanasonicVieraDevice(PollingDevice):
             return []
 
         try:
-            remote = await self._create_remote_control()
-            apps = await asyncio.to_thread(remote.get_apps)
+            apps = await self._call_remote(RemoteControl.get_apps, retry=True)
             # Ensure apps is a list (handle generators, iterators, etc.)
             return list(apps) if apps else []
         except Exception as err:
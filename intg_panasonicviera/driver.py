@@ -6,11 +6,12 @@ Panasonic Viera TV driver for Unfolded Circle Remote.
 """
 
 import logging
+import socket
 from ucapi import Entity, EntityTypes
 from ucapi.media_player import Attributes as MediaAttributes
 from ucapi_framework import BaseIntegrationDriver
 from intg_panasonicviera.config import PanasonicVieraConfig
-from intg_panasonicviera.device import PanasonicVieraDevice
+from intg_panasonicviera.device import PanasonicVieraDevice, open_wol_socket
 from intg_panasonicviera.media_player import PanasonicVieraMediaPlayer
 from intg_panasonicviera.remote import PanasonicVieraRemote
 
@@ -26,6 +27,7 @@ class PanasonicVieraDriver(BaseIntegrationDriver[PanasonicVieraDevice, Panasonic
             driver_id="panasonicviera",
         )
         self._remote_entities: dict[str, PanasonicVieraRemote] = {}
+        self._wol_sock: socket.socket | None = None
 
     def create_entities(
         self, device_config: PanasonicVieraConfig, device: PanasonicVieraDevice
@@ -38,7 +40,7 @@ class PanasonicVieraDriver(BaseIntegrationDriver[PanasonicVieraDevice, Panasonic
         # Set up callback for app discovery updates
         async def on_apps_discovered(apps):
             await remote.update_discovered_apps(apps)
-            _LOG.debug("[%s] Updated remote with %d discovered apps", device_config.identifier, len(apps))
+            _LOG.debug("[%s] Queued %d discovered apps for remote", device_config.identifier, len(apps))
 
         device._apps_update_callback = on_apps_discovered
 
@@ -49,3 +51,47 @@ class PanasonicVieraDriver(BaseIntegrationDriver[PanasonicVieraDevice, Panasonic
 
         _LOG.info("Created %d entities for %s", len(entities), device_config.name)
         return entities
+
+    def remove_device(self, device_id: str) -> None:
+        device = self._device_instances.get(device_id)
+        super().remove_device(device_id)
+        if device:
+            self._shutdown_device(device_id, device)
+
+    def clear_devices(self) -> None:
+        devices = dict(self._device_instances)
+        super().clear_devices()
+        for device_id, device in devices.items():
+            self._shutdown_device(device_id, device)
+
+    async def on_unsubscribe_entities(self, entity_ids: list[str]) -> None:
+        # The framework drops devices without entities here without going through remove_device
+        devices = dict(self._device_instances)
+        await super().on_unsubscribe_entities(entity_ids)
+        for device_id, device in devices.items():
+            if device_id not in self._device_instances:
+                self._shutdown_device(device_id, device)
+
+    def _shutdown_device(self, device_id: str, device: PanasonicVieraDevice) -> None:
+        """Release a removed device and stop its remote entity's pending work."""
+        device.shutdown()
+        remote = self._remote_entities.pop(device_id, None)
+        if remote:
+            remote.shutdown()
+
+    def wol_socket(self) -> socket.socket:
+        """Return the Wake-on-LAN socket shared by all devices, opening it on first use."""
+        if self._wol_sock is None:
+            self._wol_sock = open_wol_socket()
+        return self._wol_sock
+
+    def close_wol_socket(self) -> None:
+        if self._wol_sock is not None:
+            self._wol_sock.close()
+            self._wol_sock = None
+
+    def shutdown(self) -> None:
+        """Release per-device resources before the integration exits."""
+        for device_id, device in self._device_instances.items():
+            self._shutdown_device(device_id, device)
+        self.close_wol_socket()
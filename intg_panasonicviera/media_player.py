@@ -23,9 +23,36 @@ from intg_panasonicviera.device import PanasonicVieraDevice
 
 _LOG = logging.getLogger(__name__)
 
+# Simple commands shown for every media player; shared, options are only serialized
+_SIMPLE_COMMANDS = (
+    Commands.ON,
+    Commands.OFF,
+    Commands.VOLUME_UP,
+    Commands.VOLUME_DOWN,
+    Commands.MUTE_TOGGLE,
+    Commands.MUTE,
+    Commands.UNMUTE,
+    Commands.PLAY_PAUSE,
+    Commands.STOP,
+    Commands.NEXT,
+    Commands.PREVIOUS,
+    Commands.FAST_FORWARD,
+    Commands.REWIND,
+)
+
 
 class PanasonicVieraMediaPlayer(MediaPlayer):
 
+    # Transport commands that map straight onto a single remote key
+    _SIMPLE_KEYS = {
+        Commands.PLAY_PAUSE: "NRC_PLAY-ONOFF",
+        Commands.STOP: "NRC_STOP-ONOFF",
+        Commands.NEXT: "NRC_FF-ONOFF",
+        Commands.PREVIOUS: "NRC_REW-ONOFF",
+        Commands.FAST_FORWARD: "NRC_FF-ONOFF",
+        Commands.REWIND: "NRC_REW-ONOFF",
+    }
+
     def __init__(
         self, device_config: PanasonicVieraConfig, device: PanasonicVieraDevice
     ):
@@ -121,21 +148,7 @@ class PanasonicVieraMediaPlayer(MediaPlayer):
         }
 
         options = {
-            Options.SIMPLE_COMMANDS: [
-                Commands.ON,
-                Commands.OFF,
-                Commands.VOLUME_UP,
-                Commands.VOLUME_DOWN,
-                Commands.MUTE_TOGGLE,
-                Commands.MUTE,
-                Commands.UNMUTE,
-                Commands.PLAY_PAUSE,
-                Commands.STOP,
-                Commands.NEXT,
-                Commands.PREVIOUS,
-                Commands.FAST_FORWARD,
-                Commands.REWIND,
-            ],
+            Options.SIMPLE_COMMANDS: _SIMPLE_COMMANDS,
             "user_interface": user_interface,
         }
 
@@ -157,84 +170,57 @@ class PanasonicVieraMediaPlayer(MediaPlayer):
         _LOG.info("[%s] Command: %s %s", self.id, cmd_id, params or "")
 
         try:
-            if cmd_id == Commands.ON:
-                success = await self._device.turn_on()
-                return StatusCodes.OK if success else StatusCodes.SERVER_ERROR
-
-            elif cmd_id == Commands.OFF:
-                success = await self._device.turn_off()
-                return StatusCodes.OK if success else StatusCodes.SERVER_ERROR
-
-            elif cmd_id == Commands.VOLUME:
-                if params and "volume" in params:
-                    success = await self._device.set_volume(int(params["volume"]))
-                    return StatusCodes.OK if success else StatusCodes.SERVER_ERROR
-                return StatusCodes.BAD_REQUEST
-
-            elif cmd_id == Commands.VOLUME_UP:
-                success = await self._device.volume_up()
-                return StatusCodes.OK if success else StatusCodes.SERVER_ERROR
-
-            elif cmd_id == Commands.VOLUME_DOWN:
-                success = await self._device.volume_down()
-                return StatusCodes.OK if success else StatusCodes.SERVER_ERROR
-
-            elif cmd_id == Commands.MUTE_TOGGLE:
-                current_mute = self._device.muted
-                success = await self._device.mute(not current_mute)
-                return StatusCodes.OK if success else StatusCodes.SERVER_ERROR
-
-            elif cmd_id == Commands.MUTE:
-                success = await self._device.mute(True)
-                return StatusCodes.OK if success else StatusCodes.SERVER_ERROR
-
-            elif cmd_id == Commands.UNMUTE:
-                success = await self._device.mute(False)
+            key = self._SIMPLE_KEYS.get(cmd_id)
+            if key is not None:
+                success = await self._device.send_key(key)
                 return StatusCodes.OK if success else StatusCodes.SERVER_ERROR
 
-            elif cmd_id == Commands.PLAY_PAUSE:
-                success = await self._device.send_key("NRC_PLAY-ONOFF")
-                return StatusCodes.OK if success else StatusCodes.SERVER_ERROR
-
-            elif cmd_id == Commands.STOP:
-                success = await self._device.send_key("NRC_STOP-ONOFF")
-                return StatusCodes.OK if success else StatusCodes.SERVER_ERROR
-
-            elif cmd_id == Commands.NEXT:
-                success = await self._device.send_key("NRC_FF-ONOFF")
-                return StatusCodes.OK if success else StatusCodes.SERVER_ERROR
-
-            elif cmd_id == Commands.PREVIOUS:
-                success = await self._device.send_key("NRC_REW-ONOFF")
-                return StatusCodes.OK if success else StatusCodes.SERVER_ERROR
-
-            elif cmd_id == Commands.FAST_FORWARD:
-                success = await self._device.send_key("NRC_FF-ONOFF")
-                return StatusCodes.OK if success else StatusCodes.SERVER_ERROR
-
-            elif cmd_id == Commands.REWIND:
-                success = await self._device.send_key("NRC_REW-ONOFF")
-                return StatusCodes.OK if success else StatusCodes.SERVER_ERROR
-
-            elif cmd_id == Commands.SELECT_SOURCE:
-                if params and "source" in params:
-                    success = await self._device.select_source(params["source"])
-                    return StatusCodes.OK if success else StatusCodes.SERVER_ERROR
-                return StatusCodes.BAD_REQUEST
-
-            elif cmd_id == Commands.PLAY_MEDIA:
-                if params and "media_type" in params and "media_id" in params:
-                    media_type = params["media_type"]
-                    media_id = params["media_id"]
-
-                    if media_type == MediaType.URL or media_id.startswith("http"):
-                        success = await self._device.play_media(media_id)
-                        return StatusCodes.OK if success else StatusCodes.SERVER_ERROR
-
+            handler = self._DISPATCH.get(cmd_id)
+            if handler is None:
                 return StatusCodes.NOT_IMPLEMENTED
 
-            return StatusCodes.NOT_IMPLEMENTED
+            result = await handler(self, params)
+            if isinstance(result, StatusCodes):
+                return result
+            return StatusCodes.OK if result else StatusCodes.SERVER_ERROR
 
         except Exception as err:
             _LOG.error("[%s] Command error: %s", self.id, err)
             return StatusCodes.SERVER_ERROR
+
+    async def _cmd_volume(self, params: dict[str, Any] | None) -> StatusCodes | bool:
+        volume = params.get("volume") if params else None
+        if volume is not None:
+            return await self._device.set_volume(int(volume))
+        return StatusCodes.BAD_REQUEST
+
+    async def _cmd_select_source(self, params: dict[str, Any] | None) -> StatusCodes | bool:
+        source = params.get("source") if params else None
+        if source is not None:
+            return await self._device.select_source(source)
+        return StatusCodes.BAD_REQUEST
+
+    async def _cmd_play_media(self, params: dict[str, Any] | None) -> StatusCodes | bool:
+        if params and "media_type" in params and "media_id" in params:
+            media_type = params["media_type"]
+            media_id = params["media_id"]
+
+            if media_type == MediaType.URL or media_id.startswith("http"):
+                return await self._device.play_media(media_id)
+
+        return StatusCodes.NOT_IMPLEMENTED
+
+    # Remaining commands; handlers return a success flag or an explicit status code
+    _DISPATCH = {
+        Commands.ON: lambda self, params: self._device.turn_on(),
+        Commands.OFF: lambda self, params: self._device.turn_off(),
+        Commands.VOLUME: _cmd_volume,
+        Commands.VOLUME_UP: lambda self, params: self._device.volume_up(),
+        Commands.VOLUME_DOWN: lambda self, params: self._device.volume_down(),
+        Commands.MUTE_TOGGLE: lambda self, params: self._device.mute(not self._device.muted),
+        Commands.MUTE: lambda self, params: self._device.mute(True),
+        Commands.UNMUTE: lambda self, params: self._device.mute(False),
+        Commands.SELECT_SOURCE: _cmd_select_source,
+        # Not every ucapi release defines Commands.PLAY_MEDIA; key on its wire value
+        "play_media": _cmd_play_media,
+    }
@@ -5,7 +5,10 @@ Panasonic Viera TV Remote entity.
 :license: MPL-2.0, see LICENSE for more details.
 """
 
+import asyncio
+import functools
 import logging
+from types import MappingProxyType
 from typing import Any
 from ucapi import StatusCodes
 from ucapi.remote import Attributes, Commands, Features, Options, Remote
@@ -16,7 +19,8 @@ _LOG = logging.getLogger(__name__)
 
 # Complete list of all Panasonic Viera NRC key codes
 # Includes all keys from panasonic-viera library for maximum TV model compatibility
-VIERA_KEYS = {
+# Read-only so command handling can never alter the shared table
+VIERA_KEYS = MappingProxyType({
     # Navigation
     "UP": "NRC_UP-ONOFF",
     "DOWN": "NRC_DOWN-ONOFF",
@@ -132,11 +136,127 @@ VIERA_KEYS = {
     "NET_BS": "NRC_NET_BS-ONOFF",
     "NET_CS": "NRC_NET_CS-ONOFF",
     "NET_TD": "NRC_NET_TD-ONOFF",
-}
+})
+
+# Key names snapshotted once for building command lists
+_VIERA_KEY_LIST: tuple[str, ...] = tuple(VIERA_KEYS)
+
+# Dispatch entries for the fixed keys; app entries are layered on top per remote
+_KEY_DISPATCH: dict[str, tuple[str, Any]] = {name: ("key", code) for name, code in VIERA_KEYS.items()}
 
 # Prefix for dynamically discovered app commands
 APP_CMD_PREFIX = "APP_"
 
+# Seconds to wait for further app discovery updates before rebuilding options
+_APPS_DEBOUNCE = 0.25
+
+# Enum members used on every key press, bound once as module globals
+_SEND_CMD = Commands.SEND_CMD
+_OK = StatusCodes.OK
+_SERVER_ERROR = StatusCodes.SERVER_ERROR
+_BAD_REQUEST = StatusCodes.BAD_REQUEST
+_NOT_IMPLEMENTED = StatusCodes.NOT_IMPLEMENTED
+
+
+@functools.cache
+def _location(x: int, y: int) -> dict:
+    """Return the shared location dict for a grid cell; UI items only ever read it."""
+    return {"x": x, "y": y}
+
+
+def _text(text: str, cmd_id: str, x: int, y: int) -> dict:
+    """Return a text button for a UI page grid."""
+    return {"type": "text", "text": text, "command": {"cmd_id": cmd_id}, "location": _location(x, y)}
+
+
+def _icon(icon: str, cmd_id: str, x: int, y: int) -> dict:
+    """Return an icon button for a UI page grid."""
+    return {"type": "icon", "icon": icon, "command": {"cmd_id": cmd_id}, "location": _location(x, y)}
+
+
+# Static UI pages for navigation, playback, channels, and inputs; built once and never mutated
+_STATIC_PAGES: list[dict] = [
+    {
+        "page_id": "navigation",
+        "name": "Navigation",
+        "grid": {"width": 3, "height": 4},
+        "items": [
+            _text("Home", "HOME", 0, 0),
+            _icon("uc:up-arrow", "UP", 1, 0),
+            _text("Menu", "MENU", 2, 0),
+            _icon("uc:left-arrow", "LEFT", 0, 1),
+            _text("OK", "OK", 1, 1),
+            _icon("uc:right-arrow", "RIGHT", 2, 1),
+            _text("Back", "BACK", 0, 2),
+            _icon("uc:down-arrow", "DOWN", 1, 2),
+            _text("Exit", "EXIT", 2, 2),
+            _text("Info", "INFO", 0, 3),
+            _text("Guide", "GUIDE", 1, 3),
+            _text("Last View", "LAST_VIEW", 2, 3),
+        ],
+    },
+    {
+        "page_id": "playback",
+        "name": "Playback",
+        "grid": {"width": 3, "height": 4},
+        "items": [
+            _icon("uc:prev", "SKIP_BACK", 0, 0),
+            _icon("uc:play", "PLAY", 1, 0),
+            _icon("uc:next", "SKIP_FWD", 2, 0),
+            _icon("uc:backward", "REW", 0, 1),
+            _icon("uc:pause", "PAUSE", 1, 1),
+            _icon("uc:forward", "FF", 2, 1),
+            _icon("uc:rec", "REC", 0, 2),
+            _icon("uc:stop", "STOP", 1, 2),
+            _icon("uc:volume-xmark", "MUTE", 0, 3),
+            _icon("uc:volume-low", "VOL_DOWN", 1, 3),
+            _icon("uc:volume-high", "VOL_UP", 2, 3),
+        ],
+    },
+    {
+        "page_id": "channels",
+        "name": "Channels",
+        "grid": {"width": 3, "height": 4},
+        "items": [
+            _icon("uc:1", "NUM_1", 0, 0),
+            _icon("uc:2", "NUM_2", 1, 0),
+            _icon("uc:3", "NUM_3", 2, 0),
+            _icon("uc:4", "NUM_4", 0, 1),
+            _icon("uc:5", "NUM_5", 1, 1),
+            _icon("uc:6", "NUM_6", 2, 1),
+            _icon("uc:7", "NUM_7", 0, 2),
+            _icon("uc:8", "NUM_8", 1, 2),
+            _icon("uc:9", "NUM_9", 2, 2),
+            _icon("uc:down-arrow", "CH_DOWN", 0, 3),
+            _icon("uc:0", "NUM_0", 1, 3),
+            _icon("uc:up-arrow", "CH_UP", 2, 3),
+        ],
+    },
+    {
+        "page_id": "color_input",
+        "name": "Color & Input",
+        "grid": {"width": 4, "height": 5},
+        "items": [
+            _icon("uc:power-off", "POWER", 0, 0),
+            _text("Option", "OPTION", 2, 0),
+            _text("eHelp", "EHELP", 3, 0),
+            _text("Apps", "APPS", 0, 1),
+            _text("My App", "MY_APP", 1, 1),
+            _text("Netflix", "NETFLIX", 2, 1),
+            _text("TV", "TV", 0, 2),
+            _text("AV", "AV", 1, 2),
+            _text("HDMI1", "HDMI1", 0, 3),
+            _text("HDMI2", "HDMI2", 1, 3),
+            _text("HDMI3", "HDMI3", 2, 3),
+            _text("HDMI4", "HDMI4", 3, 3),
+            _text("Red", "RED", 0, 4),
+            _text("Green", "GREEN", 1, 4),
+            _text("Yellow", "YELLOW", 2, 4),
+            _text("Blue", "BLUE", 3, 4),
+        ],
+    },
+]
+
 
 class PanasonicVieraRemote(Remote):
 
@@ -145,8 +265,17 @@ class PanasonicVieraRemote(Remote):
     ):
         self._device = device
         self._device_config = device_config
+        # Bound once; key presses are the remote's hot path
+        self._send_key = device.send_key
         self._discovered_apps: list[Any] = []
+        self._discovered_apps_fingerprint: tuple[str, ...] = ()
+        self._app_entries: list[tuple[str, str, Any]] = []  # (name, APP_xxx command, app) per discovered app
         self._app_commands: dict[str, Any] = {}  # Maps APP_xxx command to app object
+        self._app_id_cache: dict[str, str] = {}  # Maps app name to its APP_xxx command
+        self._dispatch: dict[str, tuple[str, Any]] = {}  # Maps command to ("key", code) or ("app", app)
+        self._pending_apps: list[Any] | None = None
+        self._options_fingerprint: tuple[tuple[str, str], ...] | None = None
+        self._apps_debounce_task: asyncio.Task | None = None
 
         entity_id = f"remote.{device_config.identifier}"
         entity_name = f"{device_config.name} Remote"
@@ -167,114 +296,28 @@ class PanasonicVieraRemote(Remote):
 
     def _get_static_pages(self) -> list[dict]:
         """Return the static UI pages for navigation, playback, channels, and inputs."""
-        return [
-            {
-                "page_id": "navigation",
-                "name": "Navigation",
-                "grid": {"width": 3, "height": 4},
-                "items": [
-                    {"type": "text", "text": "Home", "command": {"cmd_id": "HOME"}, "location": {"x": 0, "y": 0}},
-                    {"type": "icon", "icon": "uc:up-arrow", "command": {"cmd_id": "UP"}, "location": {"x": 1, "y": 0}},
-                    {"type": "text", "text": "Menu", "command": {"cmd_id": "MENU"}, "location": {"x": 2, "y": 0}},
-                    {"type": "icon", "icon": "uc:left-arrow", "command": {"cmd_id": "LEFT"}, "location": {"x": 0, "y": 1}},
-                    {"type": "text", "text": "OK", "command": {"cmd_id": "OK"}, "location": {"x": 1, "y": 1}},
-                    {"type": "icon", "icon": "uc:right-arrow", "command": {"cmd_id": "RIGHT"}, "location": {"x": 2, "y": 1}},
-                    {"type": "text", "text": "Back", "command": {"cmd_id": "BACK"}, "location": {"x": 0, "y": 2}},
-                    {"type": "icon", "icon": "uc:down-arrow", "command": {"cmd_id": "DOWN"}, "location": {"x": 1, "y": 2}},
-                    {"type": "text", "text": "Exit", "command": {"cmd_id": "EXIT"}, "location": {"x": 2, "y": 2}},
-                    {"type": "text", "text": "Info", "command": {"cmd_id": "INFO"}, "location": {"x": 0, "y": 3}},
-                    {"type": "text", "text": "Guide", "command": {"cmd_id": "GUIDE"}, "location": {"x": 1, "y": 3}},
-                    {"type": "text", "text": "Last View", "command": {"cmd_id": "LAST_VIEW"}, "location": {"x": 2, "y": 3}},
-                ],
-            },
-            {
-                "page_id": "playback",
-                "name": "Playback",
-                "grid": {"width": 3, "height": 4},
-                "items": [
-                    {"type": "icon", "icon": "uc:prev", "command": {"cmd_id": "SKIP_BACK"}, "location": {"x": 0, "y": 0}},
-                    {"type": "icon", "icon": "uc:play", "command": {"cmd_id": "PLAY"}, "location": {"x": 1, "y": 0}},
-                    {"type": "icon", "icon": "uc:next", "command": {"cmd_id": "SKIP_FWD"}, "location": {"x": 2, "y": 0}},
-                    {"type": "icon", "icon": "uc:backward", "command": {"cmd_id": "REW"}, "location": {"x": 0, "y": 1}},
-                    {"type": "icon", "icon": "uc:pause", "command": {"cmd_id": "PAUSE"}, "location": {"x": 1, "y": 1}},
-                    {"type": "icon", "icon": "uc:forward", "command": {"cmd_id": "FF"}, "location": {"x": 2, "y": 1}},
-                    {"type": "icon", "icon": "uc:rec", "command": {"cmd_id": "REC"}, "location": {"x": 0, "y": 2}},
-                    {"type": "icon", "icon": "uc:stop", "command": {"cmd_id": "STOP"}, "location": {"x": 1, "y": 2}},
-                    {"type": "icon", "icon": "uc:volume-xmark", "command": {"cmd_id": "MUTE"}, "location": {"x": 0, "y": 3}},
-                    {"type": "icon", "icon": "uc:volume-low", "command": {"cmd_id": "VOL_DOWN"}, "location": {"x": 1, "y": 3}},
-                    {"type": "icon", "icon": "uc:volume-high", "command": {"cmd_id": "VOL_UP"}, "location": {"x": 2, "y": 3}},
-                ],
-            },
-            {
-                "page_id": "channels",
-                "name": "Channels",
-                "grid": {"width": 3, "height": 4},
-                "items": [
-                    {"type": "icon", "icon": "uc:1", "command": {"cmd_id": "NUM_1"}, "location": {"x": 0, "y": 0}},
-                    {"type": "icon", "icon": "uc:2", "command": {"cmd_id": "NUM_2"}, "location": {"x": 1, "y": 0}},
-                    {"type": "icon", "icon": "uc:3", "command": {"cmd_id": "NUM_3"}, "location": {"x": 2, "y": 0}},
-                    {"type": "icon", "icon": "uc:4", "command": {"cmd_id": "NUM_4"}, "location": {"x": 0, "y": 1}},
-                    {"type": "icon", "icon": "uc:5", "command": {"cmd_id": "NUM_5"}, "location": {"x": 1, "y": 1}},
-                    {"type": "icon", "icon": "uc:6", "command": {"cmd_id": "NUM_6"}, "location": {"x": 2, "y": 1}},
-                    {"type": "icon", "icon": "uc:7", "command": {"cmd_id": "NUM_7"}, "location": {"x": 0, "y": 2}},
-                    {"type": "icon", "icon": "uc:8", "command": {"cmd_id": "NUM_8"}, "location": {"x": 1, "y": 2}},
-                    {"type": "icon", "icon": "uc:9", "command": {"cmd_id": "NUM_9"}, "location": {"x": 2, "y": 2}},
-                    {"type": "icon", "icon": "uc:down-arrow", "command": {"cmd_id": "CH_DOWN"}, "location": {"x": 0, "y": 3}},
-                    {"type": "icon", "icon": "uc:0", "command": {"cmd_id": "NUM_0"}, "location": {"x": 1, "y": 3}},
-                    {"type": "icon", "icon": "uc:up-arrow", "command": {"cmd_id": "CH_UP"}, "location": {"x": 2, "y": 3}},
-                ],
-            },
-            {
-                "page_id": "color_input",
-                "name": "Color & Input",
-                "grid": {"width": 4, "height": 5},
-                "items": [
-                    {"type": "icon", "icon": "uc:power-off", "command": {"cmd_id": "POWER"}, "location": {"x": 0, "y": 0}},
-                    {"type": "text", "text": "Option", "command": {"cmd_id": "OPTION"}, "location": {"x": 2, "y": 0}},
-                    {"type": "text", "text": "eHelp", "command": {"cmd_id": "EHELP"}, "location": {"x": 3, "y": 0}},
-                    {"type": "text", "text": "Apps", "command": {"cmd_id": "APPS"}, "location": {"x": 0, "y": 1}},
-                    {"type": "text", "text": "My App", "command": {"cmd_id": "MY_APP"}, "location": {"x": 1, "y": 1}},
-                    {"type": "text", "text": "Netflix", "command": {"cmd_id": "NETFLIX"}, "location": {"x": 2, "y": 1}},
-                    {"type": "text", "text": "TV", "command": {"cmd_id": "TV"}, "location": {"x": 0, "y": 2}},
-                    {"type": "text", "text": "AV", "command": {"cmd_id": "AV"}, "location": {"x": 1, "y": 2}},
-                    {"type": "text", "text": "HDMI1", "command": {"cmd_id": "HDMI1"}, "location": {"x": 0, "y": 3}},
-                    {"type": "text", "text": "HDMI2", "command": {"cmd_id": "HDMI2"}, "location": {"x": 1, "y": 3}},
-                    {"type": "text", "text": "HDMI3", "command": {"cmd_id": "HDMI3"}, "location": {"x": 2, "y": 3}},
-                    {"type": "text", "text": "HDMI4", "command": {"cmd_id": "HDMI4"}, "location": {"x": 3, "y": 3}},
-                    {"type": "text", "text": "Red", "command": {"cmd_id": "RED"}, "location": {"x": 0, "y": 4}},
-                    {"type": "text", "text": "Green", "command": {"cmd_id": "GREEN"}, "location": {"x": 1, "y": 4}},
-                    {"type": "text", "text": "Yellow", "command": {"cmd_id": "YELLOW"}, "location": {"x": 2, "y": 4}},
-                    {"type": "text", "text": "Blue", "command": {"cmd_id": "BLUE"}, "location": {"x": 3, "y": 4}},
-                ],
-            },
-        ]
+        return _STATIC_PAGES
 
     def _generate_apps_page(self) -> dict | None:
         """Generate a dynamic Apps page from discovered apps."""
-        if not self._discovered_apps:
+        if not self._app_entries:
             return None
 
         # Max grid is 8x12, we'll use 4 columns
         grid_width = 4
         max_apps = 48  # 4 columns x 12 rows
-        apps_to_show = self._discovered_apps[:max_apps]
-
-        items = []
-        for i, app in enumerate(apps_to_show):
-            x = i % grid_width
-            y = i // grid_width
-            # Create command ID from app name (sanitized)
-            cmd_id = self._get_app_command_id(app)
-            # Handle both app objects with .name attribute and string app names
-            app_name = app.name if hasattr(app, 'name') else str(app)
-            # Truncate app name for display (max ~10 chars to fit in button)
-            display_name = app_name[:10] if len(app_name) > 10 else app_name
-            items.append({
+        apps_to_show = self._app_entries[:max_apps]
+
+        # Truncate app names for display (max ~10 chars to fit in button)
+        items = [
+            {
                 "type": "text",
-                "text": display_name,
+                "text": app_name[:10],
                 "command": {"cmd_id": cmd_id},
-                "location": {"x": x, "y": y},
-            })
+                "location": _location(i % grid_width, i // grid_width),
+            }
+            for i, (app_name, cmd_id, _) in enumerate(apps_to_show)
+        ]
 
         grid_height = min(12, (len(apps_to_show) + grid_width - 1) // grid_width)
 
@@ -285,29 +328,39 @@ class PanasonicVieraRemote(Remote):
             "items": items,
         }
 
-    def _get_app_command_id(self, app: Any) -> str:
-        """Generate a safe command ID for an app."""
-        # Handle both app objects with .name attribute and string app names
-        app_name = app.name if hasattr(app, 'name') else str(app)
-        # Sanitize app name: remove spaces/special chars, uppercase, limit to 15 chars
-        safe_name = "".join(c for c in app_name if c.isalnum()).upper()[:15]
-        return f"{APP_CMD_PREFIX}{safe_name}"
+    def _get_app_command_id(self, app_name: str) -> str:
+        """Generate a safe command ID for an app name."""
+        cmd_id = self._app_id_cache.get(app_name)
+        if cmd_id is None:
+            # Sanitize app name: remove spaces/special chars, uppercase, limit to 15 chars
+            safe_name = "".join(filter(str.isalnum, app_name)).upper()[:15]
+            cmd_id = self._app_id_cache[app_name] = f"{APP_CMD_PREFIX}{safe_name}"
+        return cmd_id
 
     def _update_options(self) -> None:
         """Update the remote options with current commands and UI."""
-        # Build simple commands list: all VIERA_KEYS + discovered app commands
-        simple_commands = list(VIERA_KEYS.keys())
-
-        # Add discovered app commands
+        # Map discovered app commands; a repeated ID keeps its first position but points at the later app
         self._app_commands.clear()
-        for app in self._discovered_apps:
-            cmd_id = self._get_app_command_id(app)
+        for _, cmd_id, app in self._app_entries:
             self._app_commands[cmd_id] = app
-            if cmd_id not in simple_commands:
-                simple_commands.append(cmd_id)
 
-        # Build UI pages
-        pages = self._get_static_pages()
+        dispatch = dict(_KEY_DISPATCH)
+        for cmd_id, app in self._app_commands.items():
+            dispatch[cmd_id] = ("app", app)
+        self._dispatch = dispatch
+
+        # Static pages never change, so the options only differ when the app commands or labels do
+        options_fingerprint = tuple((cmd_id, name[:10]) for name, cmd_id, _ in self._app_entries)
+        if options_fingerprint == self._options_fingerprint:
+            return
+        self._options_fingerprint = options_fingerprint
+
+        # Simple commands: all VIERA_KEYS + discovered app commands. APP_CMD_PREFIX keeps
+        # them disjoint; without apps the shared tuple is used as is
+        simple_commands = _VIERA_KEY_LIST + tuple(self._app_commands) if self._app_commands else _VIERA_KEY_LIST
+
+        # Build UI pages (copy the list so the apps page is not appended to the shared constant)
+        pages = list(self._get_static_pages())
 
         # Add dynamic apps page if we have discovered apps
         apps_page = self._generate_apps_page()
@@ -324,53 +377,73 @@ class PanasonicVieraRemote(Remote):
     async def update_discovered_apps(self, apps: list[Any]) -> None:
         """Update the remote with newly discovered apps from the TV."""
         # Ensure apps is always a list (handle generators, iterators, etc.)
-        apps_list = list(apps) if apps else []
-
-        if apps_list == self._discovered_apps:
+        self._pending_apps = list(apps) if apps else []
+
+        # Bursts of discovery updates (e.g. while the TV boots) collapse into one options rebuild
+        if self._apps_debounce_task is None or self._apps_debounce_task.done():
+            self._apps_debounce_task = asyncio.create_task(self._apply_pending_apps())
+
+    def shutdown(self) -> None:
+        """Cancel a pending apps update; called when the device is removed."""
+        if self._apps_debounce_task:
+            self._apps_debounce_task.cancel()
+        self._pending_apps = None
+
+    async def _apply_pending_apps(self) -> None:
+        """Apply the latest discovered apps once the update burst has settled."""
+        await asyncio.sleep(_APPS_DEBOUNCE)
+        apps_list, self._pending_apps = self._pending_apps or [], None
+
+        # Compare by app names; the TV often returns an equal list of fresh objects
+        fingerprint = tuple(app.name if hasattr(app, 'name') else str(app) for app in apps_list)
+        if fingerprint == self._discovered_apps_fingerprint:
             return
 
+        # Keep command IDs only for the current apps, so removed or renamed ones drop out
+        previous_ids = self._app_id_cache
+        self._app_id_cache = {name: previous_ids[name] for name in fingerprint if name in previous_ids}
+
         self._discovered_apps = apps_list
+        self._discovered_apps_fingerprint = fingerprint
+        # Names are resolved once here; page and command building reuse the triples
+        self._app_entries = [
+            (name, self._get_app_command_id(name), app) for name, app in zip(fingerprint, apps_list)
+        ]
         self._update_options()
         _LOG.info(
             "[%s] Updated remote with %d discovered apps: %s",
             self.id,
             len(apps_list),
-            [app.name if hasattr(app, 'name') else str(app) for app in apps_list[:10]],  # Log first 10
+            list(fingerprint[:10]),  # Log first 10
         )
 
     async def handle_command(
         self, entity: Remote, cmd_id: str, params: dict[str, Any] | None
     ) -> StatusCodes:
-        _LOG.info("[%s] Command: %s %s", self.id, cmd_id, params or "")
-
+        # Debug only: every key press also reaches the device, which logs what it sends at info
+        _LOG.debug("[%s] Command: %s %s", self.id, cmd_id, params)
+
+        if cmd_id == _SEND_CMD:
+            command = params.get("command") if params else None
+            if command is None:
+                return _BAD_REQUEST
+            # str() keeps a malformed (unhashable) command from breaking the lookup below
+            cmd_id = str(command)
+
+        # A single lookup resolves both Viera keys and discovered apps
+        entry = self._dispatch.get(cmd_id)
+        if entry is None:
+            _LOG.warning("[%s] Unknown command: %s", self.id, cmd_id)
+            return _NOT_IMPLEMENTED
+
+        kind, payload = entry
         try:
-            if cmd_id == Commands.SEND_CMD:
-                if params and "command" in params:
-                    key_name = params["command"]
-                    return await self._execute_command(key_name)
-                return StatusCodes.BAD_REQUEST
-
-            return await self._execute_command(cmd_id)
-
+            if kind == "key":
+                success = await self._send_key(payload)
+            else:
+                # The device logs the app name it launches
+                success = await self._device.launch_app(payload)
         except Exception as err:
             _LOG.error("[%s] Command error: %s", self.id, err)
-            return StatusCodes.SERVER_ERROR
-
-    async def _execute_command(self, cmd_id: str) -> StatusCodes:
-        """Execute a command by ID (either a key or an app)."""
-        # Check if it's a standard Viera key command
-        if cmd_id in VIERA_KEYS:
-            key_code = VIERA_KEYS[cmd_id]
-            success = await self._device.send_key(key_code)
-            return StatusCodes.OK if success else StatusCodes.SERVER_ERROR
-
-        # Check if it's a discovered app command
-        if cmd_id.startswith(APP_CMD_PREFIX) and cmd_id in self._app_commands:
-            app = self._app_commands[cmd_id]
-            app_name = app.name if hasattr(app, 'name') else str(app)
-            _LOG.info("[%s] Launching app: %s", self.id, app_name)
-            success = await self._device.launch_app(app)
-            return StatusCodes.OK if success else StatusCodes.SERVER_ERROR
-
-        _LOG.warning("[%s] Unknown command: %s", self.id, cmd_id)
-        return StatusCodes.NOT_IMPLEMENTED
+            return _SERVER_ERROR
+        return _OK if success else _SERVER_ERROR
@@ -8,13 +8,41 @@ Panasonic Viera TV setup flow for Unfolded Circle integration.
 import asyncio
 import logging
 from typing import Any
-from panasonic_viera import RemoteControl
+from panasonic_viera import TV_TYPE_ENCRYPTED, RemoteControl
 from ucapi import RequestUserInput, IntegrationSetupError, SetupError
 from ucapi_framework import BaseSetupFlow
 from intg_panasonicviera.config import PanasonicVieraConfig
 
 _LOG = logging.getLogger(__name__)
 
+# Separators replaced when deriving a device identifier from the host (IPv4 dots, IPv6 colons)
+_HOST_ID_TRANS = str.maketrans({".": "_", ":": "_"})
+
+# Editable fields of the PIN prompt, in display order; host and port are fixed by the first step
+_PIN_FORM_FIELDS = (
+    ("name", "TV Name"),
+    ("mac_address", "MAC Address (optional)"),
+    ("pin", "PIN Code (displayed on TV screen)"),
+)
+
+
+def _pin_form(host: str, port: int, values: dict[str, str]) -> RequestUserInput:
+    """Return the form that collects the PIN shown on the TV, carrying over the values already entered."""
+    return RequestUserInput(
+        {"en": "Enter PIN from TV"},
+        [
+            {
+                "id": "info",
+                "label": {"en": "TV"},
+                "field": {"label": {"value": {"en": f"Pairing with {host}:{port}"}}},
+            },
+            *(
+                {"id": field_id, "label": {"en": label}, "field": {"text": {"value": values.get(field_id, "")}}}
+                for field_id, label in _PIN_FORM_FIELDS
+            ),
+        ],
+    )
+
 
 class PanasonicVieraSetupFlow(BaseSetupFlow[PanasonicVieraConfig]):
     """Setup flow for Panasonic Viera TV integration with PIN pairing support."""
@@ -23,6 +51,8 @@ class PanasonicVieraSetupFlow(BaseSetupFlow[PanasonicVieraConfig]):
     # This is critical for PIN authorization - authorize_pin_code() needs the same
     # instance that called request_pin_code()
     _remote_instance: RemoteControl | None = None
+    # (host, port, name) entered in the first step, kept for the PIN step
+    _pairing_target: tuple[str, int, str] | None = None
 
     def get_manual_entry_form(self) -> RequestUserInput:
         """Define manual entry fields."""
@@ -59,13 +89,26 @@ class PanasonicVieraSetupFlow(BaseSetupFlow[PanasonicVieraConfig]):
         Validate connection and create config.
         Handles PIN pairing for encrypted TVs.
         """
-        host = input_values.get("host", "").strip()
-        if not host:
-            raise ValueError("IP address is required")
-
-        port = int(input_values.get("port", 55000))
-        name = input_values.get("name", f"Panasonic Viera ({host})").strip()
         pin = input_values.get("pin", "").strip()
+
+        if self._pairing_target is not None and "host" not in input_values:
+            # PIN step: the pairing RemoteControl is bound to the host entered in the first step,
+            # only the name may still be edited on the PIN form
+            host, port, name = self._pairing_target
+            name = input_values.get("name", "").strip() or name
+            if not pin:
+                return _pin_form(host, port, {"name": name, "mac_address": input_values.get("mac_address", "")})
+        else:
+            # A new manual entry starts over, forget any pairing that was never completed
+            self._pairing_target = None
+            self._remote_instance = None
+            host = input_values.get("host", "").strip()
+            if not host:
+                raise ValueError("IP address is required")
+
+            port = int(input_values.get("port", 55000))
+            name = input_values.get("name", f"Panasonic Viera ({host})").strip()
+
         mac_address = input_values.get("mac_address", "").strip() or None
 
         _LOG.info("Setting up Panasonic Viera TV at %s:%s", host, port)
@@ -82,15 +125,23 @@ class PanasonicVieraSetupFlow(BaseSetupFlow[PanasonicVieraConfig]):
             app_id = None
             encryption_key = None
 
+            # RemoteControl already detected the TV type from its description, an encrypted
+            # TV goes straight to pairing
+            encryption_required = remote.type == TV_TYPE_ENCRYPTED
+
             # Try to send a key to check if encryption is needed
             # Note: get_volume uses SOAP API which may not require encryption,
             # but send_key uses command API which DOES require encryption on 2018+ models
-            try:
-                # Test with a harmless INFO key - won't change TV state
-                await asyncio.to_thread(remote.send_key, "NRC_INFO-ONOFF")
-                _LOG.info("TV does not require encryption - send_key works")
-
-            except Exception as test_err:
+            if not encryption_required:
+                try:
+                    # Test with a harmless INFO key - won't change TV state
+                    await asyncio.to_thread(remote.send_key, "NRC_INFO-ONOFF")
+                    _LOG.info("TV does not require encryption - send_key works")
+                except Exception as probe_err:
+                    _LOG.debug("Encryption probe failed, trying PIN pairing: %s", probe_err)
+                    encryption_required = True
+
+            if encryption_required:
                 # TV requires encryption - need PIN pairing
                 _LOG.info("TV requires encryption - initiating PIN pairing")
 
@@ -102,38 +153,8 @@ class PanasonicVieraSetupFlow(BaseSetupFlow[PanasonicVieraConfig]):
                         _LOG.info("PIN request sent to TV - displaying on screen")
 
                         # Return form to collect PIN
-                        return RequestUserInput(
-                            {"en": "Enter PIN from TV"},
-                            [
-                                {
-                                    "id": "host",
-                                    "label": {"en": "IP Address"},
-                                    "field": {"text": {"value": host}},
-                                },
-                                {
-                                    "id": "port",
-                                    "label": {"en": "Port"},
-                                    "field": {"text": {"value": str(port)}},
-                                },
-                                {
-                                    "id": "name",
-                                    "label": {"en": "TV Name"},
-                                    "field": {"text": {"value": name}},
-                                },
-                                {
-                                    "id": "mac_address",
-                                    "label": {"en": "MAC Address (optional)"},
-                                    "field": {"text": {"value": mac_address or ""}},
-                                },
-                                {
-                                    "id": "pin",
-                                    "label": {
-                                        "en": "PIN Code (displayed on TV screen)"
-                                    },
-                                    "field": {"text": {"value": ""}},
-                                },
-                            ],
-                        )
+                        self._pairing_target = (host, port, name)
+                        return _pin_form(host, port, {"name": name, "mac_address": mac_address or ""})
 
                     except Exception as pin_err:
                         raise ValueError(
@@ -142,12 +163,14 @@ class PanasonicVieraSetupFlow(BaseSetupFlow[PanasonicVieraConfig]):
 
                 # We have a PIN - authorize and get credentials
                 try:
-                    _LOG.info("Authorizing with PIN: %s", pin)
-                    await asyncio.to_thread(remote.authorize_pin_code, pincode=pin)
+                    _LOG.debug("Authorizing with PIN (len=%d)", len(pin))
+
+                    def _authorize() -> tuple[str | None, str | None]:
+                        remote.authorize_pin_code(pincode=pin)
+                        # Get app_id and encryption_key
+                        return remote.app_id, remote.enc_key
 
-                    # Get app_id and encryption_key
-                    app_id = remote.app_id
-                    encryption_key = remote.enc_key
+                    app_id, encryption_key = await asyncio.to_thread(_authorize)
 
                     if not app_id or not encryption_key:
                         raise ValueError(
@@ -163,7 +186,7 @@ class PanasonicVieraSetupFlow(BaseSetupFlow[PanasonicVieraConfig]):
                     ) from auth_err
 
             # Create identifier
-            identifier = f"viera_{host.replace('.', '_')}_{port}"
+            identifier = f"viera_{host.translate(_HOST_ID_TRANS)}_{port}"
 
             # Verify credentials work (if encrypted)
             # Note: We use the existing 'remote' instance which already has the credentials
@@ -191,11 +214,13 @@ class PanasonicVieraSetupFlow(BaseSetupFlow[PanasonicVieraConfig]):
             _LOG.info("Setup completed successfully for %s", name)
 
             # Clear the instance for next setup
+            self._pairing_target = None
             self._remote_instance = None
 
             return config
 
         except asyncio.TimeoutError:
+            self._pairing_target = None
             self._remote_instance = None
             raise ValueError(
                 f"Connection timeout to {host}:{port}\n"
@@ -204,9 +229,11 @@ class PanasonicVieraSetupFlow(BaseSetupFlow[PanasonicVieraConfig]):
 
         except ValueError:
             # Re-raise ValueError as-is (already has good error message)
+            self._pairing_target = None
             self._remote_instance = None
             raise
 
         except Exception as err:
+            self._pairing_target = None
             self._remote_instance = None
             raise ValueError(f"Setup failed: {err}") from err